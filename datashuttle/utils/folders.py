@@ -16,7 +16,8 @@ if TYPE_CHECKING:
     from datashuttle.configs.config_class import Configs
     from datashuttle.utils.custom_types import TopLevelFolder
 
-import glob
+import fnmatch
+import os
 from pathlib import Path
 
 from datashuttle.configs import canonical_folders, canonical_tags
@@ -542,26 +543,45 @@ def search_filesystem_path_for_folders(
     search_path_with_prefix: Path, return_full_path: bool = False
 ) -> Tuple[List[Path | str], List[Path | str]]:
     """
-    Use glob to search the full search path (including prefix) with glob.
-    Files are filtered out of results, returning folders only.
+    Search the full search path (including prefix, which may contain
+    glob-style wildcards). Files are filtered out of results,
+    returning folders only.
+
+    The parent folder is read with a single `os.scandir`, which returns
+    the entry type with each name, so no separate `stat` is required
+    per file / folder to determine whether it is a folder. As with glob,
+    hidden files / folders are only matched if the prefix starts with "."
+    and a search folder that cannot be read (e.g. missing or no
+    permission) returns no results.
     """
+    search_path = search_path_with_prefix.parent
+    search_prefix = search_path_with_prefix.name
+    include_hidden = search_prefix.startswith(".")
+
     all_folder_names = []
     all_filenames = []
 
-    all_files_and_folders = list(glob.glob(search_path_with_prefix.as_posix()))
-    sorter_files_and_folders = sorted(all_files_and_folders)
-
-    for file_or_folder_str in sorter_files_and_folders:
-
-        file_or_folder = Path(file_or_folder_str)
+    try:
+        with os.scandir(search_path) as entries:
+            matched_entries = [
+                entry
+                for entry in entries
+                if (include_hidden or not entry.name.startswith("."))
+                and fnmatch.fnmatch(entry.name, search_prefix)
+            ]
+    except OSError:
+        # As with glob, folders that cannot be read return no results.
+        return [], []
+
+    for entry in sorted(matched_entries, key=lambda entry: entry.name):
+
+        to_append = (
+            search_path / entry.name if return_full_path else entry.name
+        )
 
-        if file_or_folder.is_dir():
-            all_folder_names.append(
-                file_or_folder if return_full_path else file_or_folder.name
-            )
+        if entry.is_dir():
+            all_folder_names.append(to_append)
         else:
-            all_filenames.append(
-                file_or_folder if return_full_path else file_or_folder.name
-            )
+            all_filenames.append(to_append)
 
     return all_folder_names, all_filenames
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import traceback
 import warnings
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, List, Literal, Union, overload
 
 if TYPE_CHECKING:
@@ -183,7 +184,17 @@ def get_value_from_key_regexp(name: str, key: str) -> List[str]:
     e.g. sub-001_ses-312 would find
     312 for key "ses".
     """
-    return re.findall(f"{key}-(.*?)(?=_|$)", name)
+    return get_key_value_regexp(key).findall(name)
+
+
+@lru_cache(maxsize=None)
+def get_key_value_regexp(key: str) -> re.Pattern:
+    """
+    Compile the regexp used to find the value for a key. This is
+    called for every sub / ses name in the project during validation,
+    so it is compiled once per key and cached.
+    """
+    return re.compile(f"{key}-(.*?)(?=_|$)")
 
 
 # -----------------------------------------------------------------------------
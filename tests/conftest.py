@@ -35,6 +35,15 @@ else:
     filesystem_path = "/home/joe/ceph_mount/neuroinformatics/scratch/datashuttle_tests/fake_data"
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow.",
+    )
+
+
 def pytest_configure(config):
     pytest.ssh_config = SimpleNamespace(
         TEST_SSH=test_ssh,
@@ -45,3 +54,16 @@ def pytest_configure(config):
         SERVER_PATH=server_path,  # as a mounted drive and server as the linux path to connect through SSH
     )
     test_utils.set_datashuttle_loggers(disable=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests marked as slow unless `--run-slow` is passed.
+    """
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="Requires --run-slow to run.")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
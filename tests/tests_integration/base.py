@@ -62,6 +62,15 @@ class BaseTest:
         yield project
         test_utils.teardown_project(cwd, project)
 
+    @pytest.fixture(scope="function")
+    def central_path(self, project):
+        """
+        A `central` project path next to the `local` project path,
+        computed once per test.
+        """
+        local_path = project.cfg["local_path"]
+        yield local_path.parent / "central" / project.project_name
+
     @pytest.fixture(scope="function")
     def clean_project_name(self):
         """
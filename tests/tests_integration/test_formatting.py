@@ -1,3 +1,6 @@
+import itertools
+import warnings
+
 import pytest
 from base import BaseTest
 
@@ -6,19 +9,21 @@ from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
 
 class TestFormatting(BaseTest):
-    @pytest.mark.parametrize("prefix", ["sub", "ses"])
-    @pytest.mark.parametrize(
-        "input", [1, {"test": "one"}, 1.0, ["1", "2", ["three"]]]
-    )
-    def test_format_names_bad_input(self, input, prefix):
+    def test_format_names_bad_input(self, subtests):
         """
         Test that names passed in incorrect type
         (not str, list) raise appropriate error.
         """
-        with pytest.raises(TypeError) as e:
-            formatting.format_names(input, prefix)
+        for prefix, input in itertools.product(
+            ["sub", "ses"], [1, {"test": "one"}, 1.0, ["1", "2", ["three"]]]
+        ):
+            with subtests.test(prefix=prefix, input=input):
+                with pytest.raises(TypeError) as e:
+                    formatting.format_names(input, prefix)
 
-        assert f"Ensure {prefix} names are a list of strings." == str(e.value)
+                assert f"Ensure {prefix} names are a list of strings." == str(
+                    e.value
+                )
 
     @pytest.mark.parametrize("prefix", ["sub", "ses"])
     def test_format_names_duplicate_ele(self, prefix):
@@ -72,17 +77,17 @@ class TestFormatting(BaseTest):
             ["ses-05", "ses-10"],
         )
 
-        with pytest.warns(UserWarning) as w:
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always", UserWarning)
             project.get_next_sub(top_level_folder)
+            project.get_next_ses(top_level_folder, "sub-02")
+
         assert (
             str(w[0].message) == "A subject number has been skipped, "
             "currently used subject numbers are: [1, 2, 4]"
         )
-
-        with pytest.warns(UserWarning) as w:
-            project.get_next_ses(top_level_folder, "sub-02")
         assert (
-            str(w[0].message)
+            str(w[1].message)
             == "A subject number has been skipped, currently "
             "used subject numbers are: [5, 10]"
         )
@@ -1,5 +1,7 @@
+import itertools
 import os.path
-import shutil
+import warnings
+from pathlib import Path
 
 import pytest
 from base import BaseTest
@@ -8,6 +10,40 @@ from datashuttle import quick_validate_project
 from datashuttle.utils import formatting, validation
 from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
+
+def _batch_mkdirs(paths):
+    """
+    Make all folders in `paths`, including any missing parent
+    folders, making each unique folder only once.
+    """
+    for path in sorted(set(Path(path) for path in paths)):
+        path.mkdir(parents=True, exist_ok=True)
+
+
+SUB_NAMES = ["sub-001", "sub-999_@DATE@", "sub-001_random-tag_another-tag"]
+BAD_SUB_NAMES = [
+    "sub-3",
+    "sub-04",
+    "sub-0004",
+    "sub-07_@DATE@",
+    "sub-1321",
+    "sub-22",
+    "sub-234234453_@DATETIME@",
+]
+SES_NAMES = ["ses-01", "ses-99_@DATE@", "ses-01_random-tag_another-tag"]
+BAD_SES_NAMES = [
+    "ses-3",
+    "ses-004",
+    "ses-0004",
+    "ses-007_@DATE@",
+    "ses-1453_@DATETIME@",
+    "ses-234234234",
+]
+VALUE_LENGTH_MESSAGES = {
+    prefix: validation.get_value_length_error(prefix)
+    for prefix in ["sub", "ses"]
+}
+
 # -----------------------------------------------------------------------------
 # Inconsistent sub or ses value lengths
 # -----------------------------------------------------------------------------
@@ -15,127 +51,129 @@ from datashuttle.utils.custom_exceptions import NeuroBlueprintError
 
 class TestValidation(BaseTest):
 
+    @pytest.fixture(scope="function")
+    def central_rawdata(self, project, central_path):
+        """
+        Set the project `central_path` once for the test and return
+        the central `rawdata` path. `project` is function-scoped so
+        this fixture cannot be shared more widely.
+
+        Validation reads the in-memory configs, so these are set directly
+        rather than writing the config file with `update_config_file()`.
+        """
+        os.makedirs(central_path, exist_ok=True)
+        project.cfg["central_path"] = central_path
+
+        yield project.cfg["central_path"] / "rawdata"
+
+    @pytest.mark.filesystem
+    @pytest.mark.parametrize("prefix", ["sub", "ses"])
     @pytest.mark.parametrize(
-        "sub_name",
-        ["sub-001", "sub-999_@DATE@", "sub-001_random-tag_another-tag"],
-    )
-    @pytest.mark.parametrize(
-        "bad_sub_name",
+        "name_location, bad_name_location",
         [
-            "sub-3",
-            "sub-04",
-            "sub-0004",
-            "sub-07_@DATE@",
-            "sub-1321",
-            "sub-22",
-            "sub-234234453_@DATETIME@",
+            ("local", "local"),
+            pytest.param("local", "central", marks=pytest.mark.slow),
+            pytest.param("central", "central", marks=pytest.mark.slow),
         ],
     )
-    def test_warn_on_inconsistent_sub_value_lengths(
-        self, project, sub_name, bad_sub_name
+    def test_warn_on_inconsistent_sub_or_ses_value_lengths(
+        self,
+        project,
+        central_rawdata,
+        subtests,
+        prefix,
+        name_location,
+        bad_name_location,
     ):
         """
-        This test checks that inconsistent sub value lengths are properly
-        detected across the project. This is performed with an assortment
-        of possible filenames and leading zero conflicts.
+        This test checks that inconsistent sub or ses value lengths are
+        properly detected across the project. This is performed with an
+        assortment of possible filenames and leading zero conflicts.
 
         These conflicts are detected across the project (i.e. if you have
         sub-03 in remote and sub-004 in local, a warning should be shown).
         Therefore this function tests every combination of conflict across
-        local and central).
+        local and central). The cases involving central are marked slow
+        and only run with `--run-slow`.
+
+        Every combination of names is checked on the same project,
+        each in a separate subtest.
 
         Note SSH version is not tested, but the core functionality detecting
         inconsistent leading zeros is agnostic to SSH, and SSH file searching
         is tested elsewhere.
         """
-        # First make conflicting leading zero subject names in the local repo
-        sub_name = formatting.format_names([sub_name], "sub")[0]
-        bad_sub_name = formatting.format_names([bad_sub_name], "sub")[0]
+        include_central = "central" in [name_location, bad_name_location]
 
-        os.makedirs(project.cfg["local_path"] / "rawdata" / sub_name)
-        os.makedirs(project.cfg["local_path"] / "rawdata" / bad_sub_name)
-
-        self.check_inconsistent_sub_or_ses_value_length_warning(
-            project, include_central=False
-        )
-
-        # Now, have conflicting subject names,
-        # but one in local and one in central
-        new_central_path = (
-            project.cfg["local_path"].parent / "central" / project.project_name
-        )
-        os.makedirs(new_central_path, exist_ok=True)
-
-        project.update_config_file(central_path=new_central_path)
-        os.makedirs(project.cfg["central_path"] / "rawdata" / bad_sub_name)
-        shutil.rmtree(project.cfg["local_path"] / "rawdata" / bad_sub_name)
-        self.check_inconsistent_sub_or_ses_value_length_warning(project)
-
-        # Have conflicting subject names both in central.
-        shutil.rmtree(project.cfg["local_path"] / "rawdata" / sub_name)
-        os.makedirs(project.cfg["central_path"] / "rawdata" / sub_name)
-        self.check_inconsistent_sub_or_ses_value_length_warning(project)
-
-    @pytest.mark.parametrize(
-        "ses_name",
-        ["ses-01", "ses-99_@DATE@", "ses-01_random-tag_another-tag"],
-    )
-    @pytest.mark.parametrize(
-        "bad_ses_name",
-        [
-            "ses-3",
-            "ses-004",
-            "ses-0004",
-            "ses-007_@DATE@",
-            "ses-1453_@DATETIME@",
-            "ses-234234234",
-        ],
-    )
-    def test_warn_on_inconsistent_ses_value_lengths(
-        self, project, ses_name, bad_ses_name
+        rawdata_paths = {
+            "local": project.cfg["local_path"] / "rawdata",
+            "central": central_rawdata,
+        }
+        _batch_mkdirs(rawdata_paths.values())
+
+        names, bad_names = {
+            "sub": (SUB_NAMES, BAD_SUB_NAMES),
+            "ses": (SES_NAMES, BAD_SES_NAMES),
+        }[prefix]
+
+        for name, bad_name in itertools.product(
+            formatting.format_names(names, prefix),
+            formatting.format_names(bad_names, prefix),
+        ):
+            with subtests.test(name=name, bad_name=bad_name):
+                self._run_inconsistent_lengths_test(
+                    project,
+                    prefix,
+                    rawdata_paths[name_location],
+                    name,
+                    rawdata_paths[bad_name_location],
+                    bad_name,
+                    include_central,
+                )
+
+    def _run_inconsistent_lengths_test(
+        self,
+        project,
+        prefix,
+        rawdata_path,
+        name,
+        bad_rawdata_path,
+        bad_name,
+        include_central,
     ):
         """
-        This function is exactly the same as
-        `test_warn_on_inconsistent_sub_value_lengths()` but operates at the
-        session level. This is extreme code duplication, but
-        factoring the main logic out got very messy and hard to follow.
-        """
-        ses_name = formatting.format_names([ses_name], "ses")[0]
-        bad_ses_name = formatting.format_names([bad_ses_name], "ses")[0]
+        Make the conflicting `name` and `bad_name` folders, check the
+        VALUE_LENGTH warning is shown and remove the folders again.
 
-        # Have conflicting session names (in different subject directories)
-        # on the local filesystem
-        os.makedirs(
-            project.cfg["local_path"] / "rawdata" / "sub-001" / ses_name
-        )
-        os.makedirs(
-            project.cfg["local_path"] / "rawdata" / "sub-002" / bad_ses_name
-        )
-        self.check_inconsistent_sub_or_ses_value_length_warning(
-            project, include_central=False
-        )
-
-        # Now, have conflicting session names (in different subject
-        # directories) where one subject directory is local and the
-        # other is central.
-        new_central_path = (
-            project.cfg["local_path"].parent / "central" / project.project_name
-        )
-        os.makedirs(new_central_path, exist_ok=True)
-
-        project.update_config_file(central_path=new_central_path)
-        os.makedirs(
-            project.cfg["central_path"] / "rawdata" / "sub-001" / bad_ses_name
-        )
-        shutil.rmtree(project.cfg["local_path"] / "rawdata" / "sub-002")
-        self.check_inconsistent_sub_or_ses_value_length_warning(project)
+        Sessions are made within subject folders. When both sessions
+        are local, they are made in different subject folders. Otherwise,
+        both are made in `sub-001` (which is split across local and
+        central in the mixed case).
+        """
+        if prefix == "sub":
+            paths = [rawdata_path / name, bad_rawdata_path / bad_name]
+        else:
+            bad_sub_name = "sub-001" if include_central else "sub-002"
+            paths = [
+                rawdata_path / "sub-001" / name,
+                bad_rawdata_path / bad_sub_name / bad_name,
+            ]
+        _batch_mkdirs(paths)
+
+        # The project is shared across all name pairs, so the folders
+        # must be removed even if the check fails, or they would
+        # affect the following pairs.
+        try:
+            self.check_inconsistent_sub_or_ses_value_length_warning(
+                project, [prefix], include_central=include_central
+            )
+        finally:
+            for path_ in paths:
+                os.rmdir(path_)
 
-        # Test the case where conflicting session names are both on central.
-        shutil.rmtree(project.cfg["local_path"] / "rawdata" / "sub-001")
-        os.makedirs(
-            project.cfg["central_path"] / "rawdata" / "sub-001" / ses_name
-        )
-        self.check_inconsistent_sub_or_ses_value_length_warning(project)
+            if prefix == "ses":
+                for path_ in set(path_.parent for path_ in paths):
+                    os.rmdir(path_)
 
     @pytest.mark.parametrize("project", ["local", "full"], indirect=True)
     def test_warn_on_inconsistent_sub_and_ses_value_lengths(self, project):
@@ -143,29 +181,33 @@ class TestValidation(BaseTest):
         Test that warning is shown for both subject and session when
         inconsistent zeros are found in both.
         """
-        os.makedirs(
-            project.cfg["local_path"] / "rawdata" / "sub-001" / "ses-01"
-        )
-        os.makedirs(
-            project.cfg["local_path"] / "rawdata" / "sub-03" / "ses-002"
-        )
-        self.check_inconsistent_sub_or_ses_value_length_warning(
-            project, include_central=False
+        local_raw = project.cfg["local_path"] / "rawdata"
+
+        _batch_mkdirs(
+            [
+                local_raw / "sub-001" / "ses-01",
+                local_raw / "sub-03" / "ses-002",
+            ]
         )
         self.check_inconsistent_sub_or_ses_value_length_warning(
-            project, warn_idx=1, include_central=False
+            project, ["sub", "ses"], include_central=False
         )
 
     def check_inconsistent_sub_or_ses_value_length_warning(
-        self, project, warn_idx=0, include_central=True
+        self, project, prefixes, include_central=True
     ):
-        """"""
-        with pytest.warns(UserWarning) as w:
+        """
+        Validate the project once and check that the VALUE_LENGTH
+        warnings for each of `prefixes` are shown, in order.
+        """
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always", UserWarning)
             project.validate_project(
                 "rawdata", display_mode="warn", include_central=include_central
             )
 
-        assert "VALUE_LENGTH" in str(w[warn_idx].message)
+        for warn_idx, prefix in enumerate(prefixes):
+            assert str(w[warn_idx].message) == VALUE_LENGTH_MESSAGES[prefix]
 
     # -------------------------------------------------------------------------
     # Test duplicates when making folders
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from datashuttle.utils import folders
+
+
+class TestFoldersUnit:
+    @pytest.fixture(scope="function")
+    def search_path(self, tmp_path):
+        """
+        Make a folder to search containing subject folders, a hidden
+        folder, a file and a symlink to a folder (which should
+        be treated as a folder, as with glob).
+        """
+        for folder_name in ["sub-002", "sub-001", ".hidden", "other"]:
+            (tmp_path / folder_name).mkdir()
+        (tmp_path / "sub-003.txt").write_text("test_entry")
+        os.symlink(tmp_path / "other", tmp_path / "sub-004_link")
+
+        yield tmp_path
+
+    @pytest.mark.parametrize(
+        "search_prefix, expected_folders, expected_files",
+        [
+            ("sub-*", ["sub-001", "sub-002", "sub-004_link"], ["sub-003.txt"]),
+            (".*", [".hidden"], []),
+            (
+                "*",
+                ["other", "sub-001", "sub-002", "sub-004_link"],
+                ["sub-003.txt"],
+            ),
+            ("sub-001", ["sub-001"], []),
+        ],
+    )
+    @pytest.mark.parametrize("return_full_path", [True, False])
+    def test_search_filesystem_path_for_folders(
+        self,
+        search_path,
+        search_prefix,
+        expected_folders,
+        expected_files,
+        return_full_path,
+    ):
+        """
+        Check folders and files are split, sorted, and that hidden
+        entries are only found when the prefix starts with ".".
+        """
+        all_folders, all_files = folders.search_filesystem_path_for_folders(
+            search_path / search_prefix, return_full_path
+        )
+
+        if return_full_path:
+            expected_folders = [
+                search_path / name for name in expected_folders
+            ]
+            expected_files = [search_path / name for name in expected_files]
+
+        assert all_folders == expected_folders
+        assert all_files == expected_files
+
+    @pytest.mark.parametrize("return_full_path", [True, False])
+    def test_search_filesystem_path_for_folders_missing_parent(
+        self, tmp_path, return_full_path
+    ):
+        """
+        Searching within a folder that does not exist returns no results.
+        """
+        assert folders.search_filesystem_path_for_folders(
+            tmp_path / "not_a_folder" / "sub-*", return_full_path
+        ) == ([], [])
+
+    def test_search_filesystem_path_for_folders_unreadable(
+        self, mocker, search_path
+    ):
+        """
+        Searching a folder that cannot be read (e.g. no permission)
+        returns no results, as glob does, rather than raising.
+        """
+        mocker.patch(
+            "datashuttle.utils.folders.os.scandir",
+            side_effect=PermissionError("Permission denied"),
+        )
+
+        assert folders.search_filesystem_path_for_folders(
+            search_path / "sub-*"
+        ) == ([], [])